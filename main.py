@@ -5,8 +5,10 @@ from utils.charts import (
     create_expense_pie_chart,
     create_portfolio_pie_chart,
     create_goals_progress_chart,
+    create_goal_probability_chart,
     create_expense_trend_chart
 )
+from utils.forecasting import average_monthly_total, complete_months, project_goals, simulate_goal_outcomes
 import requests
 import streamlit.components.v1 as components
 
@@ -28,6 +30,11 @@ def get_data_manager():
 
 data_manager = get_data_manager()
 
+# Filter choices for the transaction browser; cached so paging doesn't rescan the table
+@st.cache_data(ttl=300)
+def get_transaction_filter_options():
+    return data_manager.get_account_options(), data_manager.get_transaction_categories()
+
 # Sidebar navigation
 st.sidebar.title("Navigation")
 page = st.sidebar.radio("Go to", ["Overview", "Bank Accounts", "Expenses", "Investments", "Goals"], key="nav")
@@ -156,6 +163,7 @@ if page == "Bank Accounts":
         if st.button("Sync Transactions", key="sync"):
             with st.spinner("Syncing transactions..."):
                 data_manager.sync_transactions()
+            get_transaction_filter_options.clear()
             st.success("Transactions synced successfully!")
     else:
         st.info("No bank accounts connected yet. Click 'Link New Account' to get started!")
@@ -168,7 +176,66 @@ if page == "Overview":
 # Expenses Page
 if page == "Expenses":
     st.title("Expenses")
-    # Add expenses content here
+
+    # Transaction browser: filters are applied in the database and only one page is fetched per run
+    st.subheader("Transactions")
+    account_options, category_options = get_transaction_filter_options()
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        account_id = st.selectbox(
+            "Account",
+            [None] + list(account_options.keys()),
+            format_func=lambda a: "All accounts" if a is None else account_options[a],
+            key="txn_account"
+        )
+        search = st.text_input("Search", key="txn_search").strip() or None
+    with col2:
+        category = st.selectbox(
+            "Category",
+            [None] + category_options,
+            format_func=lambda c: "All categories" if c is None else c,
+            key="txn_category"
+        )
+        page_size = st.selectbox("Rows per page", [25, 50, 100], index=1, key="txn_page_size")
+    with col3:
+        min_amount = st.number_input("Min amount", value=None, key="txn_min_amount")
+        max_amount = st.number_input("Max amount", value=None, key="txn_max_amount")
+
+    # Restart from the first page whenever the filters change
+    filters = (account_id, category, min_amount, max_amount, search, page_size)
+    if st.session_state.get('txn_filters') != filters:
+        st.session_state['txn_filters'] = filters
+        st.session_state['txn_cursors'] = [None]
+
+    # Stack of cursors for the pages visited so far; the last one is the current page
+    cursors = st.session_state['txn_cursors']
+    transactions, next_cursor = data_manager.get_transactions_page(
+        page_size=page_size,
+        after=cursors[-1],
+        account_id=account_id,
+        category=category,
+        min_amount=min_amount,
+        max_amount=max_amount,
+        search=search
+    )
+
+    if not transactions.empty:
+        st.dataframe(transactions, use_container_width=True, hide_index=True)
+    else:
+        st.info("No transactions match the selected filters.")
+
+    prev_col, page_col, next_col = st.columns([1, 2, 1])
+    with prev_col:
+        if st.button("← Previous", key="txn_prev", disabled=len(cursors) == 1):
+            cursors.pop()
+            st.rerun()
+    with page_col:
+        st.write(f"Page {len(cursors)}")
+    with next_col:
+        if st.button("Next →", key="txn_next", disabled=next_cursor is None):
+            cursors.append(next_cursor)
+            st.rerun()
 
 # Investments Page
 if page == "Investments":
@@ -178,6 +245,75 @@ if page == "Investments":
 # Goals Page
 if page == "Goals":
     st.title("Goals")
-    # Add goals content here
+
+    with st.expander("+ Add Goal"):
+        with st.form("add_goal", clear_on_submit=True):
+            name = st.text_input("Name")
+            target = st.number_input("Target amount", min_value=0.0, step=100.0)
+            current = st.number_input("Saved so far", min_value=0.0, step=100.0)
+            deadline = st.date_input("Deadline")
+            if st.form_submit_button("Add Goal") and name:
+                data_manager.add_goal(name, target, current, deadline)
+                st.success(f"Added goal '{name}'")
+
+    goals = data_manager.get_goals()
+    if not goals.empty:
+        # Savings capacity from income minus spending over the last complete months
+        months = complete_months()
+        history_start, history_end = months[0].date(), (months[-1] + pd.DateOffset(months=1)).date()
+        spending = average_monthly_total(data_manager.get_monthly_spending(history_start, history_end), months)
+        deposits = average_monthly_total(data_manager.get_monthly_deposits(history_start, history_end), months)
+        col1, col2 = st.columns(2)
+        with col1:
+            monthly_income = st.number_input(
+                "Monthly income",
+                min_value=0.0,
+                value=round(deposits, 2),
+                step=100.0,
+                help="Defaults to the average monthly deposits into your linked accounts",
+                key="goal_income"
+            )
+        with col2:
+            st.metric(f"Average monthly spending ({months[0]:%b %Y} - {months[-1]:%b %Y})", f"${spending:,.2f}")
+        monthly_savings = max(monthly_income - spending, 0.0)
+
+        st.plotly_chart(create_goals_progress_chart(goals), use_container_width=True)
+
+        if monthly_savings > 0:
+            projections = project_goals(goals, monthly_savings)
+
+            st.subheader("Projections")
+            st.dataframe(
+                projections[['name', 'remaining', 'required_monthly', 'allocated_monthly', 'projected_completion', 'on_track']],
+                use_container_width=True,
+                hide_index=True
+            )
+
+            # Monte Carlo scenarios for goals funded from investments
+            st.subheader("Investment Scenarios")
+            invested = st.multiselect("Investment-funded goals", goals['name'].tolist(), key="goal_invested")
+            col1, col2 = st.columns(2)
+            with col1:
+                annual_return = st.slider("Expected annual return (%)", 0.0, 15.0, 7.0, 0.5, key="goal_return") / 100
+            with col2:
+                annual_volatility = st.slider("Annual volatility (%)", 0.0, 40.0, 15.0, 0.5, key="goal_volatility") / 100
+
+            if invested:
+                selected = goals['name'].isin(invested).to_numpy()
+                outcomes = simulate_goal_outcomes(
+                    goals.loc[selected, 'current'],
+                    goals.loc[selected, 'target'],
+                    projections.loc[selected, 'months_left'],
+                    projections.loc[selected, 'allocated_monthly'],
+                    annual_return=annual_return,
+                    annual_volatility=annual_volatility
+                )
+                outcomes.insert(0, 'name', goals.loc[selected, 'name'].to_numpy())
+                st.plotly_chart(create_goal_probability_chart(outcomes), use_container_width=True)
+                st.dataframe(outcomes, use_container_width=True, hide_index=True)
+        else:
+            st.info("Enter a monthly income above your average spending to project your goals.")
+    else:
+        st.info("No goals yet. Add one above to see projections.")
 
 from flask import Flask, request, jsonify #This import remains here because it is used in server.py
\ No newline at end of file
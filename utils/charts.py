@@ -41,6 +41,22 @@ def create_goals_progress_chart(goals):
     
     return fig
 
+def create_goal_probability_chart(outcomes):
+    fig = go.Figure(go.Bar(
+        x=outcomes['name'],
+        y=outcomes['probability'] * 100,
+        marker_color='#00B386'
+    ))
+
+    fig.update_layout(
+        title='Chance of Reaching Goal by Deadline',
+        yaxis_title='Probability (%)',
+        yaxis_range=[0, 100],
+        showlegend=False
+    )
+
+    return fig
+
 def create_expense_trend_chart(expenses):
     daily_expenses = expenses.groupby('date')['amount'].sum().reset_index()
     fig = px.line(
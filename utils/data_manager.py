@@ -2,7 +2,7 @@ import pandas as pd
 from datetime import datetime
 from .models import get_db, Expense, Investment, FinancialGoal, PlaidAccount, Transaction
 from .plaid_client import PlaidClient
-from sqlalchemy import func
+from sqlalchemy import Date, cast, func, or_, tuple_
 import os
 
 class DataManager:
@@ -62,6 +62,70 @@ class DataManager:
                 'last_sync': a.last_sync
             } for a in accounts])
 
+    def get_account_options(self):
+        with get_db() as db:
+            accounts = db.query(PlaidAccount.id, PlaidAccount.account_name).order_by(PlaidAccount.id).all()
+            return {a.id: a.account_name for a in accounts}
+
+    def get_transaction_categories(self):
+        with get_db() as db:
+            categories = db.query(Transaction.category).filter(
+                Transaction.category.isnot(None)
+            ).distinct().order_by(Transaction.category).all()
+            return [c for (c,) in categories]
+
+    def get_transactions_page(self, page_size=50, after=None, account_id=None, category=None,
+                              min_amount=None, max_amount=None, search=None):
+        """Fetch one page of transactions, newest first.
+
+        Uses keyset pagination on (date, id): `after` is the (date, id) cursor of the
+        last row of the previous page, so every page is an index range scan no matter
+        how deep into the history it is. Unfiltered, account and category queries each
+        have a matching (.., date, id) index; amount range and text search are not
+        index-backed and are checked against the rows the seek walks. Returns
+        (DataFrame, next_cursor), where next_cursor is None on the last page.
+        """
+        with get_db() as db:
+            query = db.query(Transaction, PlaidAccount.account_name).outerjoin(
+                PlaidAccount, Transaction.account_id == PlaidAccount.id
+            )
+
+            if account_id is not None:
+                query = query.filter(Transaction.account_id == account_id)
+            if category is not None:
+                query = query.filter(Transaction.category == category)
+            if min_amount is not None:
+                query = query.filter(Transaction.amount >= min_amount)
+            if max_amount is not None:
+                query = query.filter(Transaction.amount <= max_amount)
+            if search:
+                query = query.filter(or_(
+                    Transaction.description.icontains(search, autoescape=True),
+                    Transaction.merchant_name.icontains(search, autoescape=True)
+                ))
+            if after is not None:
+                query = query.filter(tuple_(Transaction.date, Transaction.id) < tuple_(*after))
+
+            # Fetch one extra row to know whether another page exists
+            rows = query.order_by(
+                Transaction.date.desc(), Transaction.id.desc()
+            ).limit(page_size + 1).all()
+
+            has_more = len(rows) > page_size
+            rows = rows[:page_size]
+            next_cursor = (rows[-1][0].date, rows[-1][0].id) if has_more else None
+
+            page = pd.DataFrame([{
+                'date': t.date,
+                'account': account_name,
+                'category': t.category or 'Uncategorized',
+                'merchant': t.merchant_name,
+                'description': t.description,
+                'amount': t.amount
+            } for t, account_name in rows])
+
+            return page, next_cursor
+
     # Expense Methods
     def add_expense(self, date, category, amount, description):
         with get_db() as db:
@@ -136,6 +200,45 @@ class DataManager:
 
             return pd.Series(category_totals)
 
+    def get_monthly_spending(self, start, end):
+        """Spending per calendar month for dates in [start, end)."""
+        with get_db() as db:
+            manual_month = cast(func.date_trunc('month', Expense.date), Date)
+            manual_totals = db.query(
+                manual_month.label('month'),
+                func.sum(Expense.amount).label('amount')
+            ).filter(
+                Expense.date >= start, Expense.date < end
+            ).group_by(manual_month).all()
+
+            # Positive Plaid amounts are outflows; negative ones are deposits
+            plaid_month = cast(func.date_trunc('month', Transaction.date), Date)
+            plaid_totals = db.query(
+                plaid_month.label('month'),
+                func.sum(Transaction.amount).label('amount')
+            ).filter(
+                Transaction.amount > 0, Transaction.date >= start, Transaction.date < end
+            ).group_by(plaid_month).all()
+
+            monthly_totals = {}
+            for month, amount in manual_totals + plaid_totals:
+                monthly_totals[month] = monthly_totals.get(month, 0.0) + amount
+
+            return pd.Series(monthly_totals, dtype=float).sort_index()
+
+    def get_monthly_deposits(self, start, end):
+        """Money deposited into linked accounts per calendar month for dates in [start, end)."""
+        with get_db() as db:
+            month = cast(func.date_trunc('month', Transaction.date), Date)
+            deposits = db.query(
+                month.label('month'),
+                func.sum(-Transaction.amount).label('amount')
+            ).filter(
+                Transaction.amount < 0, Transaction.date >= start, Transaction.date < end
+            ).group_by(month).all()
+
+            return pd.Series({m: amount for m, amount in deposits}, dtype=float).sort_index()
+
     # Investment Methods
     def get_investments(self):
         with get_db() as db:
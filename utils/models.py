@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine, Column, Integer, Float, String, Date, ForeignKey, DateTime, text
+from sqlalchemy import create_engine, Column, Integer, Float, String, Date, ForeignKey, DateTime, Index, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship, scoped_session
 from sqlalchemy.pool import QueuePool
@@ -95,6 +95,13 @@ class Transaction(Base):
 
     account = relationship("PlaidAccount", backref="transactions")
 
+    # Composite indexes backing keyset pagination on (date, id)
+    __table_args__ = (
+        Index('ix_transactions_date_id', 'date', 'id'),
+        Index('ix_transactions_account_date_id', 'account_id', 'date', 'id'),
+        Index('ix_transactions_category_date_id', 'category', 'date', 'id'),
+    )
+
 class Expense(Base):
     __tablename__ = "expenses"
 
@@ -131,5 +138,22 @@ def init_db():
         print(f"Error creating database tables: {str(e)}")
         raise
 
+# One-off step for tables created before an index was added: create_all skips
+# indexes on existing tables, and a plain CREATE INDEX would lock writes
+def create_transaction_indexes():
+    # CONCURRENTLY cannot run inside a transaction block
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        for index in Transaction.__table__.indexes:
+            columns = ", ".join(column.name for column in index.columns)
+            print(f"Creating index {index.name}...")
+            conn.execute(text(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index.name} "
+                f"ON {Transaction.__tablename__} ({columns})"
+            ))
+
 # Initialize database
-init_db()
\ No newline at end of file
+init_db()
+
+if __name__ == "__main__":
+    # python -m utils.models
+    create_transaction_indexes()
\ No newline at end of file